@@ -16,252 +16,573 @@ except ImportError:
         # setuptools_scm is not available, use a default version
         __version__ = "0.0.0+unknown"
 
+import os
+import importlib
 import warnings
+from typing import TYPE_CHECKING
+
+
+def _get_num_thread_workers():
+    for env_var in [
+        "QUIMB_NUM_THREAD_WORKERS",
+        "QUIMB_NUM_PROCS",
+        "OMP_NUM_THREADS",
+    ]:
+        if env_var in os.environ:
+            return int(os.environ[env_var])
+
+    import psutil
+
+    return psutil.cpu_count(logical=False)
+
+
+_NUM_THREAD_WORKERS = _get_num_thread_workers()
+
+# this needs to be set before numba is first imported, lazily via quimb.core
+if "NUMBA_NUM_THREADS" in os.environ:
+    if int(os.environ["NUMBA_NUM_THREADS"]) != _NUM_THREAD_WORKERS:
+        warnings.warn(
+            "'NUMBA_NUM_THREADS' has been set elsewhere and doesn't match the "
+            "value 'quimb' has tried to set - "
+            f"{os.environ['NUMBA_NUM_THREADS']} vs {_NUM_THREAD_WORKERS}."
+        )
+else:
+    os.environ["NUMBA_NUM_THREADS"] = str(_NUM_THREAD_WORKERS)
+
 
 # some useful math
 from math import pi, cos, sin, tan, exp, log, log2, log10, sqrt
 
-# Core functions
-from .core import (
-    qarray,
-    prod,
-    isket,
-    isbra,
-    isop,
-    isvec,
-    issparse,
-    isdense,
-    isreal,
-    isherm,
-    ispos,
-    mul,
-    dag,
-    dot,
-    vdot,
-    rdot,
-    ldmul,
-    rdmul,
-    outer,
-    explt,
-    get_thread_pool,
-    normalize,
-    chop,
-    quimbify,
-    qu,
-    ket,
-    bra,
-    dop,
-    sparse,
-    infer_size,
-    trace,
-    identity,
-    eye,
-    speye,
-    dim_map,
-    dim_compress,
-    kron,
-    kronpow,
-    ikron,
-    pkron,
-    permute,
-    itrace,
-    partial_trace,
-    expectation,
-    expec,
-    nmlz,
-    tr,
-    ptr,
-)
+# Public names are loaded lazily from these submodules on first access, so
+# that e.g. ``import quimb`` doesn't pull in scipy, numba and friends
+_LAZY_IMPORTS = {
+    # Core functions
+    ".core": (
+        "qarray",
+        "prod",
+        "isket",
+        "isbra",
+        "isop",
+        "isvec",
+        "issparse",
+        "isdense",
+        "isreal",
+        "isherm",
+        "ispos",
+        "mul",
+        "dag",
+        "dot",
+        "vdot",
+        "rdot",
+        "ldmul",
+        "rdmul",
+        "outer",
+        "explt",
+        "get_thread_pool",
+        "normalize",
+        "chop",
+        "quimbify",
+        "qu",
+        "ket",
+        "bra",
+        "dop",
+        "sparse",
+        "infer_size",
+        "trace",
+        "identity",
+        "eye",
+        "speye",
+        "dim_map",
+        "dim_compress",
+        "kron",
+        "kronpow",
+        "ikron",
+        "pkron",
+        "permute",
+        "itrace",
+        "partial_trace",
+        "expectation",
+        "expec",
+        "nmlz",
+        "tr",
+        "ptr",
+    ),
+    # Linear algebra functions
+    ".linalg.base_linalg": (
+        "eigensystem",
+        "eig",
+        "eigh",
+        "eigvals",
+        "eigvalsh",
+        "eigvecs",
+        "eigvecsh",
+        "eigensystem_partial",
+        "groundstate",
+        "groundenergy",
+        "bound_spectrum",
+        "eigh_window",
+        "eigvalsh_window",
+        "eigvecsh_window",
+        "svd",
+        "svds",
+        "norm",
+        "expm",
+        "sqrtm",
+        "expm_multiply",
+        "Lazy",
+    ),
+    ".linalg.rand_linalg": (
+        "rsvd",
+        "estimate_rank",
+    ),
+    ".linalg.mpi_launcher": (
+        "get_mpi_pool",
+        "can_use_mpi_pool",
+    ),
+    # Generating objects
+    ".gen.operators": (
+        "spin_operator",
+        "pauli",
+        "hadamard",
+        "phase_gate",
+        "S_gate",
+        "T_gate",
+        "U_gate",
+        "rotation",
+        "Rx",
+        "Ry",
+        "Rz",
+        "Xsqrt",
+        "Ysqrt",
+        "Zsqrt",
+        "Wsqrt",
+        "swap",
+        "iswap",
+        "fsim",
+        "fsimg",
+        "ncontrolled_gate",
+        "controlled",
+        "CNOT",
+        "cX",
+        "cY",
+        "cZ",
+        "ccX",
+        "ccY",
+        "ccZ",
+        "controlled_swap",
+        "cswap",
+        "fredkin",
+        "toffoli",
+        "ham_heis",
+        "ham_ising",
+        "ham_XY",
+        "ham_XXZ",
+        "ham_j1j2",
+        "ham_mbl",
+        "ham_heis_2D",
+        "zspin_projector",
+        "create",
+        "destroy",
+        "num",
+        "ham_hubbard_hardcore",
+    ),
+    ".gen.states": (
+        "basis_vec",
+        "up",
+        "zplus",
+        "down",
+        "zminus",
+        "plus",
+        "xplus",
+        "minus",
+        "xminus",
+        "yplus",
+        "yminus",
+        "bloch_state",
+        "bell_state",
+        "singlet",
+        "thermal_state",
+        "neel_state",
+        "singlet_pairs",
+        "werner_state",
+        "ghz_state",
+        "w_state",
+        "levi_civita",
+        "perm_state",
+        "graph_state_1d",
+        "computational_state",
+    ),
+    ".gen.rand": (
+        "randn",
+        "rand",
+        "rand_matrix",
+        "rand_herm",
+        "rand_pos",
+        "rand_rho",
+        "rand_ket",
+        "rand_uni",
+        "rand_haar_state",
+        "gen_rand_haar_states",
+        "rand_mix",
+        "rand_product_state",
+        "rand_matrix_product_state",
+        "rand_mps",
+        "rand_seperable",
+        "rand_iso",
+        "rand_mera",
+        "seed_rand",
+        "set_rand_bitgen",
+    ),
+    # Functions for calculating properties
+    ".calc": (
+        "fidelity",
+        "purify",
+        "entropy",
+        "entropy_subsys",
+        "mutual_information",
+        "mutinf",
+        "mutinf_subsys",
+        "schmidt_gap",
+        "tr_sqrt",
+        "tr_sqrt_subsys",
+        "partial_transpose",
+        "negativity",
+        "logarithmic_negativity",
+        "logneg",
+        "logneg_subsys",
+        "concurrence",
+        "one_way_classical_information",
+        "quantum_discord",
+        "trace_distance",
+        "cprint",
+        "decomp",
+        "pauli_decomp",
+        "bell_decomp",
+        "correlation",
+        "pauli_correlations",
+        "ent_cross_matrix",
+        "qid",
+        "is_degenerate",
+        "is_eigenvector",
+        "page_entropy",
+        "heisenberg_energy",
+        "dephase",
+        "kraus_op",
+        "projector",
+        "measure",
+        "simulate_counts",
+    ),
+    # Evolution class and methods
+    ".evo": (
+        "Evolution",
+    ),
+    ".linalg.approx_spectral": (
+        "approx_spectral_function",
+        "tr_abs_approx",
+        "tr_exp_approx",
+        "tr_sqrt_approx",
+        "tr_xlogx_approx",
+        "entropy_subsys_approx",
+        "logneg_subsys_approx",
+        "negativity_subsys_approx",
+        "xlogx",
+    ),
+    ".utils": (
+        "save_to_disk",
+        "load_from_disk",
+        "oset",
+        "LRU",
+        "tree_map",
+        "tree_apply",
+        "tree_flatten",
+        "tree_unflatten",
+        "format_number_with_error",
+        "NEUTRAL_STYLE",
+        "default_to_neutral_style",
+    ),
+}
+
+if TYPE_CHECKING:
+    # explicit imports for static analysis (docs, type checkers and IDEs),
+    # at runtime these are all resolved lazily by ``__getattr__`` below
+    from .core import (
+        qarray,
+        prod,
+        isket,
+        isbra,
+        isop,
+        isvec,
+        issparse,
+        isdense,
+        isreal,
+        isherm,
+        ispos,
+        mul,
+        dag,
+        dot,
+        vdot,
+        rdot,
+        ldmul,
+        rdmul,
+        outer,
+        explt,
+        get_thread_pool,
+        normalize,
+        chop,
+        quimbify,
+        qu,
+        ket,
+        bra,
+        dop,
+        sparse,
+        infer_size,
+        trace,
+        identity,
+        eye,
+        speye,
+        dim_map,
+        dim_compress,
+        kron,
+        kronpow,
+        ikron,
+        pkron,
+        permute,
+        itrace,
+        partial_trace,
+        expectation,
+        expec,
+        nmlz,
+        tr,
+        ptr,
+    )
+    from .linalg.base_linalg import (
+        eigensystem,
+        eig,
+        eigh,
+        eigvals,
+        eigvalsh,
+        eigvecs,
+        eigvecsh,
+        eigensystem_partial,
+        groundstate,
+        groundenergy,
+        bound_spectrum,
+        eigh_window,
+        eigvalsh_window,
+        eigvecsh_window,
+        svd,
+        svds,
+        norm,
+        expm,
+        sqrtm,
+        expm_multiply,
+        Lazy,
+    )
+    from .linalg.rand_linalg import (
+        rsvd,
+        estimate_rank,
+    )
+    from .linalg.mpi_launcher import (
+        get_mpi_pool,
+        can_use_mpi_pool,
+    )
+    from .gen.operators import (
+        spin_operator,
+        pauli,
+        hadamard,
+        phase_gate,
+        S_gate,
+        T_gate,
+        U_gate,
+        rotation,
+        Rx,
+        Ry,
+        Rz,
+        Xsqrt,
+        Ysqrt,
+        Zsqrt,
+        Wsqrt,
+        swap,
+        iswap,
+        fsim,
+        fsimg,
+        ncontrolled_gate,
+        controlled,
+        CNOT,
+        cX,
+        cY,
+        cZ,
+        ccX,
+        ccY,
+        ccZ,
+        controlled_swap,
+        cswap,
+        fredkin,
+        toffoli,
+        ham_heis,
+        ham_ising,
+        ham_XY,
+        ham_XXZ,
+        ham_j1j2,
+        ham_mbl,
+        ham_heis_2D,
+        zspin_projector,
+        create,
+        destroy,
+        num,
+        ham_hubbard_hardcore,
+    )
+    from .gen.states import (
+        basis_vec,
+        up,
+        zplus,
+        down,
+        zminus,
+        plus,
+        xplus,
+        minus,
+        xminus,
+        yplus,
+        yminus,
+        bloch_state,
+        bell_state,
+        singlet,
+        thermal_state,
+        neel_state,
+        singlet_pairs,
+        werner_state,
+        ghz_state,
+        w_state,
+        levi_civita,
+        perm_state,
+        graph_state_1d,
+        computational_state,
+    )
+    from .gen.rand import (
+        randn,
+        rand,
+        rand_matrix,
+        rand_herm,
+        rand_pos,
+        rand_rho,
+        rand_ket,
+        rand_uni,
+        rand_haar_state,
+        gen_rand_haar_states,
+        rand_mix,
+        rand_product_state,
+        rand_matrix_product_state,
+        rand_mps,
+        rand_seperable,
+        rand_iso,
+        rand_mera,
+        seed_rand,
+        set_rand_bitgen,
+    )
+    from .calc import (
+        fidelity,
+        purify,
+        entropy,
+        entropy_subsys,
+        mutual_information,
+        mutinf,
+        mutinf_subsys,
+        schmidt_gap,
+        tr_sqrt,
+        tr_sqrt_subsys,
+        partial_transpose,
+        negativity,
+        logarithmic_negativity,
+        logneg,
+        logneg_subsys,
+        concurrence,
+        one_way_classical_information,
+        quantum_discord,
+        trace_distance,
+        cprint,
+        decomp,
+        pauli_decomp,
+        bell_decomp,
+        correlation,
+        pauli_correlations,
+        ent_cross_matrix,
+        qid,
+        is_degenerate,
+        is_eigenvector,
+        page_entropy,
+        heisenberg_energy,
+        dephase,
+        kraus_op,
+        projector,
+        measure,
+        simulate_counts,
+    )
+    from .evo import (
+        Evolution,
+    )
+    from .linalg.approx_spectral import (
+        approx_spectral_function,
+        tr_abs_approx,
+        tr_exp_approx,
+        tr_sqrt_approx,
+        tr_xlogx_approx,
+        entropy_subsys_approx,
+        logneg_subsys_approx,
+        negativity_subsys_approx,
+        xlogx,
+    )
+    from .utils import (
+        save_to_disk,
+        load_from_disk,
+        oset,
+        LRU,
+        tree_map,
+        tree_apply,
+        tree_flatten,
+        tree_unflatten,
+        format_number_with_error,
+        NEUTRAL_STYLE,
+        default_to_neutral_style,
+    )
+
+_LAZY = {
+    name: submodule
+    for submodule, names in _LAZY_IMPORTS.items()
+    for name in names
+}
 
-# Linear algebra functions
-from .linalg.base_linalg import (
-    eigensystem,
-    eig,
-    eigh,
-    eigvals,
-    eigvalsh,
-    eigvecs,
-    eigvecsh,
-    eigensystem_partial,
-    groundstate,
-    groundenergy,
-    bound_spectrum,
-    eigh_window,
-    eigvalsh_window,
-    eigvecsh_window,
-    svd,
-    svds,
-    norm,
-    expm,
-    sqrtm,
-    expm_multiply,
-    Lazy,
-)
-from .linalg.rand_linalg import rsvd, estimate_rank
-from .linalg.mpi_launcher import get_mpi_pool, can_use_mpi_pool
+# submodules that used to be loaded by the eager imports and are still accessed
+# as attributes, e.g. ``quimb.utils.pairwise`` or ``quimb.tensor``
+_LAZY_SUBMODULES = {
+    "core",
+    "calc",
+    "evo",
+    "gen",
+    "linalg",
+    "utils",
+    "tensor",
+}
 
-# Generating objects
-from .gen.operators import (
-    spin_operator,
-    pauli,
-    hadamard,
-    phase_gate,
-    S_gate,
-    T_gate,
-    U_gate,
-    rotation,
-    Rx,
-    Ry,
-    Rz,
-    Xsqrt,
-    Ysqrt,
-    Zsqrt,
-    Wsqrt,
-    swap,
-    iswap,
-    fsim,
-    fsimg,
-    ncontrolled_gate,
-    controlled,
-    CNOT,
-    cX,
-    cY,
-    cZ,
-    ccX,
-    ccY,
-    ccZ,
-    controlled_swap,
-    cswap,
-    fredkin,
-    toffoli,
-    ham_heis,
-    ham_ising,
-    ham_XY,
-    ham_XXZ,
-    ham_j1j2,
-    ham_mbl,
-    ham_heis_2D,
-    zspin_projector,
-    create,
-    destroy,
-    num,
-    ham_hubbard_hardcore,
-)
-from .gen.states import (
-    basis_vec,
-    up,
-    zplus,
-    down,
-    zminus,
-    plus,
-    xplus,
-    minus,
-    xminus,
-    yplus,
-    yminus,
-    bloch_state,
-    bell_state,
-    singlet,
-    thermal_state,
-    neel_state,
-    singlet_pairs,
-    werner_state,
-    ghz_state,
-    w_state,
-    levi_civita,
-    perm_state,
-    graph_state_1d,
-    computational_state,
-)
-from .gen.rand import (
-    randn,
-    rand,
-    rand_matrix,
-    rand_herm,
-    rand_pos,
-    rand_rho,
-    rand_ket,
-    rand_uni,
-    rand_haar_state,
-    gen_rand_haar_states,
-    rand_mix,
-    rand_product_state,
-    rand_matrix_product_state,
-    rand_mps,
-    rand_seperable,
-    rand_iso,
-    rand_mera,
-    seed_rand,
-    set_rand_bitgen,
-)
 
-# Functions for calculating properties
-from .calc import (
-    fidelity,
-    purify,
-    entropy,
-    entropy_subsys,
-    mutual_information,
-    mutinf,
-    mutinf_subsys,
-    schmidt_gap,
-    tr_sqrt,
-    tr_sqrt_subsys,
-    partial_transpose,
-    negativity,
-    logarithmic_negativity,
-    logneg,
-    logneg_subsys,
-    concurrence,
-    one_way_classical_information,
-    quantum_discord,
-    trace_distance,
-    cprint,
-    decomp,
-    pauli_decomp,
-    bell_decomp,
-    correlation,
-    pauli_correlations,
-    ent_cross_matrix,
-    qid,
-    is_degenerate,
-    is_eigenvector,
-    page_entropy,
-    heisenberg_energy,
-    dephase,
-    kraus_op,
-    projector,
-    measure,
-    simulate_counts,
-)
+def __getattr__(name):
+    if name in _LAZY_SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+
+    try:
+        submodule = _LAZY[name]
+    except KeyError:
+        raise AttributeError(
+            f"module {__name__!r} has no attribute {name!r}"
+        ) from None
+
+    obj = getattr(importlib.import_module(submodule, __name__), name)
+    # cache so that subsequent lookups bypass this function entirely
+    globals()[name] = obj
+    return obj
 
-# Evolution class and methods
-from .evo import Evolution
 
-from .linalg.approx_spectral import (
-    approx_spectral_function,
-    tr_abs_approx,
-    tr_exp_approx,
-    tr_sqrt_approx,
-    tr_xlogx_approx,
-    entropy_subsys_approx,
-    logneg_subsys_approx,
-    negativity_subsys_approx,
-    xlogx,
-)
-from .utils import (
-    save_to_disk,
-    load_from_disk,
-    oset,
-    LRU,
-    tree_map,
-    tree_apply,
-    tree_flatten,
-    tree_unflatten,
-    format_number_with_error,
-    NEUTRAL_STYLE,
-    default_to_neutral_style,
-)
+def __dir__():
+    return sorted({*globals(), *__all__})
 
 
 warnings.filterwarnings("ignore", message="Caching is not available when ")
@@ -25,32 +25,8 @@ except ImportError:
 #                            Accelerated Functions                            #
 # --------------------------------------------------------------------------- #
 
-for env_var in [
-    "QUIMB_NUM_THREAD_WORKERS",
-    "QUIMB_NUM_PROCS",
-    "OMP_NUM_THREADS",
-]:
-    if env_var in os.environ:
-        _NUM_THREAD_WORKERS = int(os.environ[env_var])
-        break
-else:
-    import psutil
-
-    _NUM_THREAD_WORKERS = psutil.cpu_count(logical=False)
-
-if "NUMBA_NUM_THREADS" in os.environ:
-    if int(os.environ["NUMBA_NUM_THREADS"]) != _NUM_THREAD_WORKERS:
-        import warnings
-
-        warnings.warn(
-            "'NUMBA_NUM_THREADS' has been set elsewhere and doesn't match the "
-            "value 'quimb' has tried to set - "
-            f"{os.environ['NUMBA_NUM_THREADS']} vs {_NUM_THREAD_WORKERS}."
-        )
-else:
-    os.environ["NUMBA_NUM_THREADS"] = str(_NUM_THREAD_WORKERS)
-
-# need to set NUMBA_NUM_THREADS first
+# NUMBA_NUM_THREADS is set in quimb/__init__.py, before numba is imported
+from . import _NUM_THREAD_WORKERS
 import numba  # noqa
 
 _NUMBA_CACHE = {
@@ -1723,6 +1699,7 @@ def ikron(
     }
 
     def gen_ops():
+        # identities are yielded just as their (integer) size
         cff_id = 1  # keeps track of compressing adjacent identities
         cff_ov = 1  # keeps track of overlaying op on multiple dimensions
         for ind, dim in enumerate(dims):
@@ -1732,7 +1709,7 @@ def ikron(
 
                 # check if need preceding identities
                 if cff_id > 1:
-                    yield eye(cff_id, **eye_kws)
+                    yield cff_id
                     cff_id = 1  # reset cumulative identity size
 
                 # check if first subsystem in placement block
@@ -1758,10 +1735,31 @@ def ikron(
 
         # check if trailing identity needed
         if cff_id > 1:
-            yield eye(cff_id, **eye_kws)
+            yield cff_id
+
+    ops_and_ids = tuple(gen_ops())
+
+    if (
+        (not sparse)
+        and (ownership is None)
+        and (len(ops_and_ids) <= 26)
+        and all(
+            isinstance(op, Integral)
+            or (
+                not issparse(op)
+                and (op.ndim == 2)
+                and (op.shape[0] == op.shape[1])
+            )
+            for op in ops_and_ids
+        )
+    ):
+        return _ikron_dense(ops_and_ids, dtype)
 
     return kron(
-        *gen_ops(),
+        *(
+            eye(op, **eye_kws) if isinstance(op, Integral) else op
+            for op in ops_and_ids
+        ),
         stype=stype,
         coo_build=coo_build,
         parallel=parallel,
@@ -1769,6 +1767,64 @@ def ikron(
     )
 
 
+@functools.lru_cache(2**12)
+def _ikron_dense_eq(is_op):
+    """Get the einsum equation for the outer product of the non-identity
+    operators, with all row indices first then all column indices.
+    """
+    rows = [chr(ord("a") + k) for k, o in enumerate(is_op) if o]
+    cols = [r.upper() for r in rows]
+    return (
+        ",".join(r + c for r, c in zip(rows, cols))
+        + f"->{''.join(rows + cols)}"
+    )
+
+
+@ensure_qarray
+def _ikron_dense(ops, dtype):
+    """Dense kronecker product of ``ops``, where identities are given simply
+    by their integer size. Rather than multiplying each operator by the
+    identities, the outer product of the operators is written directly into
+    the corresponding diagonal blocks of the zeroed output.
+    """
+    is_op = tuple(not isinstance(op, Integral) for op in ops)
+    dims = [op.shape[0] if o else op for op, o in zip(ops, is_op)]
+    D = prod(dims)
+
+    out = np.zeros((D, D), dtype=dtype)
+
+    # explicitly strided view of the output, indexed by every row subsystem
+    # and then the column subsystems of the operators only - the columns of
+    # each identity subsystem are identified with its rows, i.e. diagonal
+    out_nd = out.reshape(dims + dims)
+    row_strides = out_nd.strides[: len(dims)]
+    col_strides = out_nd.strides[len(dims) :]
+    view = np.lib.stride_tricks.as_strided(
+        out_nd,
+        shape=dims + [d for d, o in zip(dims, is_op) if o],
+        strides=[
+            rs if o else rs + cs
+            for rs, cs, o in zip(row_strides, col_strides, is_op)
+        ]
+        + [cs for cs, o in zip(col_strides, is_op) if o],
+        writeable=True,
+    )
+
+    op_arrays = [np.asarray(op) for op, o in zip(ops, is_op) if o]
+    if len(op_arrays) == 1:
+        X = op_arrays[0]
+    else:
+        X = np.einsum(_ikron_dense_eq(is_op), *op_arrays)
+
+    # insert broadcastable axes for the identity subsystems
+    view[...] = X.reshape(
+        [d if o else 1 for d, o in zip(dims, is_op)]
+        + [d for d, o in zip(dims, is_op) if o]
+    )
+
+    return out
+
+
 @ensure_qarray
 def _permute_dense(p, dims, perm):
     """Permute the subsytems of a dense array."""
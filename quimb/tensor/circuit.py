@@ -13,6 +13,7 @@ import numpy as np
 from autoray import do, reshape, backend_like
 
 import quimb as qu
+from ..core import njit
 from ..utils import progbar as _progbar
 from ..utils import (
     concatv,
@@ -24,12 +25,14 @@ from ..utils import (
 )
 from .tensor_core import (
     get_tags,
+    maybe_realify_scalar,
     oset_union,
     PTensor,
     rand_uuid,
     tags_to_oset,
     tensor_contract,
     Tensor,
+    TensorNetwork,
 )
 from .tensor_builder import (
     MPS_computational_state,
@@ -956,6 +959,16 @@ def _cached_param_gate_build(fn, params):
     return fn(params)
 
 
+@functools.lru_cache(2**12)
+def _dense_gate_perms(axes, ndim):
+    """Get the permutation that moves ``axes`` to the front of an array with
+    ``ndim`` dimensions, as well as its inverse.
+    """
+    perm = (*axes, *(ax for ax in range(ndim) if ax not in axes))
+    inv_perm = tuple(map(int, np.argsort(perm)))
+    return perm, inv_perm
+
+
 class Gate:
     """A simple class for storing the details of a gate.
 
@@ -1122,6 +1135,23 @@ class Gate:
         )
 
 
+def sample_bits_from_prob_ndarray(p):
+    """Sample bits from n-dimensional tensor ``p`` of probabilities, returning
+    them as an array of ``uint8``, one entry per dimension.
+
+    Examples
+    --------
+
+        >>> import numpy as np
+        >>> p = np.zeros(shape=(2, 2, 2, 2, 2))
+        >>> p[0, 1, 0, 1, 1] = 1.0
+        >>> sample_bits_from_prob_ndarray(p)
+        array([0, 1, 0, 1, 1], dtype=uint8)
+    """
+    b = np.random.choice(np.arange(p.size), p=p.flat)
+    return np.array(np.unravel_index(b, p.shape), dtype=np.uint8)
+
+
 def sample_bitstring_from_prob_ndarray(p):
     """Sample a bitstring from n-dimensional tensor ``p`` of probabilities.
 
@@ -1134,8 +1164,87 @@ def sample_bitstring_from_prob_ndarray(p):
         >>> sample_bitstring_from_prob_ndarray(p)
         '01011'
     """
-    b = np.random.choice(np.arange(p.size), p=p.flat)
-    return f"{b:0>{p.ndim}b}"
+    return bits_to_bitstring(sample_bits_from_prob_ndarray(p))
+
+
+_BITS_TO_ASCII = bytes.maketrans(b"\x00\x01", b"01")
+
+
+def bits_to_bitstring(bits):
+    """Convert a sequence of 0s and 1s, e.g. ``bytes`` or an array of
+    ``uint8``, into a bitstring like ``'01011'``.
+    """
+    return bytes(bits).translate(_BITS_TO_ASCII).decode()
+
+
+@njit  # pragma: no cover
+def _bits_to_int(bits):
+    x = 0
+    for b in bits:
+        x = (x << 1) | b
+    return x
+
+
+def _refine_tensor_labels(tensors, ind_map, output_inds, labels):
+    """Iteratively refine integer ``labels`` of ``tensors`` by their
+    neighbourhoods until the partition they define is stable.
+    """
+
+    def signature(i):
+        t = tensors[i]
+        neighbs = (
+            (
+                t.ind_size(ix),
+                ix in output_inds,
+                tuple(sorted(labels[j] for j in ind_map[ix] if j != i)),
+            )
+            for ix in t.inds
+        )
+        return labels[i], tuple(sorted(neighbs))
+
+    while True:
+        sigs = [signature(i) for i in range(len(tensors))]
+        ranks = {sig: r for r, sig in enumerate(sorted(set(sigs)))}
+        new_labels = [ranks[sig] for sig in sigs]
+        if len(ranks) == len(set(labels)):
+            return new_labels
+        labels = new_labels
+
+
+def _canonize_tn_order(tn, output_inds=()):
+    """Get a copy of ``tn`` (sharing data) with its tensors reordered, and
+    their indices transposed, into an order that depends only on the
+    structure of the network, not the tensor order or index names. Isomorphic
+    networks thus generally have the same equation (ties between tensors are
+    broken by individualization and refinement, as in graph canonization).
+    """
+    tensors = tuple(tn)
+    ind_map = {}
+    for i, t in enumerate(tensors):
+        for ix in t.inds:
+            ind_map.setdefault(ix, []).append(i)
+    ix_o = {ix: k for k, ix in enumerate(output_inds)}
+
+    labels = _refine_tensor_labels(tensors, ind_map, ix_o, [0] * len(tensors))
+    while len(set(labels)) < len(tensors):
+        # individualize the first tensor of the first tied class and refine
+        tied = min(lb for lb in labels if labels.count(lb) > 1)
+        i = labels.index(tied)
+        labels = [
+            2 * lb + (lb == tied and j != i) for j, lb in enumerate(labels)
+        ]
+        labels = _refine_tensor_labels(tensors, ind_map, ix_o, labels)
+
+    def ind_key(ix):
+        return (ix_o.get(ix, -1), sorted(labels[j] for j in ind_map[ix]))
+
+    return TensorNetwork(
+        (
+            tensors[i].transpose(*sorted(tensors[i].inds, key=ind_key))
+            for i in sorted(range(len(tensors)), key=labels.__getitem__)
+        ),
+        virtual=True,
+    )
 
 
 def rehearsal_dict(tn, info):
@@ -1432,14 +1541,19 @@ class Circuit:
             site_map={i: "0" for i in range(N)}, dtype=dtype
         )
 
-    def _apply_gate(self, gate, tags=None, **gate_opts):
-        """Apply a ``Gate`` to this ``Circuit``."""
+    def _get_gate_tags(self, gate, tags=None):
+        """Get the full set of tags for the next ``Gate`` to be applied."""
         tags = tags_to_oset(tags)
         tags.add(f"GATE_{len(self.gates)}")
         if gate.round is not None:
             tags.add(f"ROUND_{gate.round}")
         if gate.tag is not None:
             tags.add(gate.tag)
+        return tags
+
+    def _apply_gate(self, gate, tags=None, **gate_opts):
+        """Apply a ``Gate`` to this ``Circuit``."""
+        tags = self._get_gate_tags(gate, tags)
 
         # overide any default gate opts
         opts = {**self.gate_opts, **gate_opts}
@@ -2178,6 +2292,70 @@ class Circuit:
         # return a copy so we can modify it inplace
         return rho_lc.copy()
 
+    def get_norm_expression(self, optimize="auto-hq"):
+        """Get the norm tensor network, ``<psi|psi>``, of the current
+        wavefunction along with a callable expression that contracts its
+        arrays. The expression is cached on the shapes and indices of the
+        norm tensor network, so that the contraction path is only found once
+        for as long as the structure of the circuit doesn't change.
+
+        Parameters
+        ----------
+        optimize : str, optional
+            Contraction path optimizer to use for the norm.
+
+        Returns
+        -------
+        norm : TensorNetwork
+            The norm tensor network, whose arrays, in order, should be supplied
+            to ``expr``.
+        expr : callable
+            The contraction expression, call like ``expr(*norm.arrays)``.
+        """
+        self._maybe_init_storage()
+
+        norm = self.psi.make_norm()
+
+        key = (
+            "norm_expression",
+            optimize,
+            tuple(t.shape for t in norm),
+            tuple(t.inds for t in norm),
+        )
+        try:
+            expr = self._storage[key]
+        except KeyError:
+            expr = self._storage[key] = norm.contract(
+                all, output_inds=(), optimize=optimize, get="expression"
+            )
+
+        return norm, expr
+
+    def norm(self, optimize="auto-hq", backend=None):
+        r"""Compute the norm of the current wavefunction,
+
+        .. math::
+
+            \| \psi \| = \sqrt{\langle \psi | \psi \rangle}
+
+        reusing the cached contraction expression from
+        :meth:`~quimb.tensor.circuit.Circuit.get_norm_expression`.
+
+        Parameters
+        ----------
+        optimize : str, optional
+            Contraction path optimizer to use for the norm.
+        backend : str, optional
+            Backend to perform the contraction with, e.g. ``'numpy'``,
+            ``'cupy'`` or ``'jax'``.
+
+        Returns
+        -------
+        scalar
+        """
+        norm, expr = self.get_norm_expression(optimize=optimize)
+        return maybe_realify_scalar(expr(*norm.arrays, backend=backend))**0.5
+
     def amplitude(
         self,
         b,
@@ -2327,6 +2505,118 @@ class Circuit:
 
     amplitude_tn = functools.partialmethod(amplitude_rehearse, rehearse="tn")
 
+    def amplitudes(
+        self,
+        bs,
+        optimize="auto-hq",
+        simplify_sequence="ADCRS",
+        simplify_atol=1e-12,
+        simplify_equalize_norms=False,
+        backend=None,
+        dtype="complex128",
+    ):
+        r"""Get the amplitude coefficients of many bitstrings ``bs``,
+
+        .. math::
+
+            c_b = \langle b | \psi \rangle
+
+        Unlike repeatedly calling
+        :meth:`~quimb.tensor.circuit.Circuit.amplitude`, the wavefunction is
+        simplified without reference to any particular bitstring, and then
+        projected onto each bitstring by attaching computational basis vectors
+        to its physical indices. The structure is thus the same for every
+        bitstring and a single contraction expression (cached, with the
+        wavefunction tensors as constants) is reused for all of them.
+
+        Parameters
+        ----------
+        bs : sequence of str or sequence of sequence of int
+            The bitstrings to compute the transition amplitudes for.
+        optimize : str, optional
+            Contraction path optimizer to use for the amplitudes.
+        simplify_sequence : str, optional
+            Which local tensor network simplifications to perform and in which
+            order, see
+            :meth:`~quimb.tensor.tensor_core.TensorNetwork.full_simplify`.
+        simplify_atol : float, optional
+            The tolerance with which to compare to zero when applying
+            :meth:`~quimb.tensor.tensor_core.TensorNetwork.full_simplify`.
+        simplify_equalize_norms : bool, optional
+            Actively renormalize tensor norms during simplification.
+        backend : str, optional
+            Backend to perform the contraction with, e.g. ``'numpy'``,
+            ``'cupy'`` or ``'jax'``.
+        dtype : str, optional
+            Data type to cast the TN to before contraction.
+
+        Returns
+        -------
+        array_like
+            The amplitudes, in the same order as ``bs``.
+        """
+        # check the bitstrings before doing any expensive preparation
+        bs = tuple(bs)
+        for b in bs:
+            if len(b) != self.N:
+                raise ValueError(
+                    f"Bit-string {b} length does not "
+                    f"match number of qubits {self.N}."
+                )
+            if any(x not in (0, 1, "0", "1") for x in b):
+                raise ValueError(
+                    f"Bit-string {b} should only contain 0s and 1s."
+                )
+
+        if not bs:
+            return np.empty(0, dtype=dtype)
+
+        self._maybe_init_storage()
+
+        fs_opts = {
+            "seq": simplify_sequence,
+            "atol": simplify_atol,
+            "equalize_norms": simplify_equalize_norms,
+        }
+
+        # the two computational basis vectors, to attach to each site
+        basis = (
+            np.array([1.0, 0.0], dtype=dtype),
+            np.array([0.0, 1.0], dtype=dtype),
+        )
+
+        key = (
+            "amplitudes_expression",
+            simplify_sequence,
+            simplify_atol,
+            simplify_equalize_norms,
+            optimize,
+            dtype,
+        )
+        try:
+            expr = self._storage[key]
+        except KeyError:
+            psi_b = self.get_psi_simplified(**fs_opts)
+            psi_b.astype_(dtype)
+            nconst = psi_b.num_tensors
+
+            # placeholder projectors, always last so we know their position
+            for i in range(self.N):
+                psi_b |= Tensor(basis[0], inds=(psi_b.site_ind(i),))
+
+            expr = self._storage[key] = psi_b.contract(
+                all,
+                output_inds=(),
+                optimize=optimize,
+                get="expression",
+                constants=range(nconst),
+            )
+
+        cs = [
+            expr(*(basis[int(x)] for x in b), backend=backend) for b in bs
+        ]
+        return do("stack", cs)
+
     def partial_trace(
         self,
         keep,
@@ -2425,6 +2715,50 @@ class Circuit:
     )
     partial_trace_tn = functools.partialmethod(partial_trace, rehearse="tn")
 
+    def _get_local_expectation_tn(
+        self,
+        G,
+        where,
+        simplify_sequence="ADCRS",
+        simplify_atol=1e-12,
+        simplify_equalize_norms=False,
+        dtype="complex128",
+    ):
+        """Get the simplified tensor network for the expectation of ``G`` at
+        ``where``, along with its output indices.
+        """
+        if isinstance(where, numbers.Integral):
+            where = (where,)
+
+        fs_opts = {
+            "seq": simplify_sequence,
+            "atol": simplify_atol,
+            "equalize_norms": simplify_equalize_norms,
+        }
+
+        rho = self.get_rdm_lightcone_simplified(where=where, **fs_opts)
+        k_inds = tuple(self.ket_site_ind(i) for i in where)
+        b_inds = tuple(self.bra_site_ind(i) for i in where)
+
+        if isinstance(G, (list, tuple)):
+            # if we have multiple expectations create an extra indexed stack
+            nG = len(G)
+            G_data = do("stack", G)
+            G_data = reshape(G_data, (nG,) + (2,) * 2 * len(where))
+            output_inds = (rand_uuid(),)
+        else:
+            G_data = reshape(G, (2,) * 2 * len(where))
+            output_inds = ()
+
+        TG = Tensor(data=G_data, inds=output_inds + b_inds + k_inds)
+
+        rhoG = rho | TG
+
+        rhoG.full_simplify_(output_inds=output_inds, **fs_opts)
+        rhoG.astype_(dtype)
+
+        return rhoG, output_inds
+
     def local_expectation(
         self,
         G,
@@ -2486,35 +2820,14 @@ class Circuit:
         -------
         scalar, tuple[scalar] or dict
         """
-        if isinstance(where, numbers.Integral):
-            where = (where,)
-
-        fs_opts = {
-            "seq": simplify_sequence,
-            "atol": simplify_atol,
-            "equalize_norms": simplify_equalize_norms,
-        }
-
-        rho = self.get_rdm_lightcone_simplified(where=where, **fs_opts)
-        k_inds = tuple(self.ket_site_ind(i) for i in where)
-        b_inds = tuple(self.bra_site_ind(i) for i in where)
-
-        if isinstance(G, (list, tuple)):
-            # if we have multiple expectations create an extra indexed stack
-            nG = len(G)
-            G_data = do("stack", G)
-            G_data = reshape(G_data, (nG,) + (2,) * 2 * len(where))
-            output_inds = (rand_uuid(),)
-        else:
-            G_data = reshape(G, (2,) * 2 * len(where))
-            output_inds = ()
-
-        TG = Tensor(data=G_data, inds=output_inds + b_inds + k_inds)
-
-        rhoG = rho | TG
-
-        rhoG.full_simplify_(output_inds=output_inds, **fs_opts)
-        rhoG.astype_(dtype)
+        rhoG, output_inds = self._get_local_expectation_tn(
+            G,
+            where,
+            simplify_sequence=simplify_sequence,
+            simplify_atol=simplify_atol,
+            simplify_equalize_norms=simplify_equalize_norms,
+            dtype=dtype,
+        )
 
         if rehearse == "tn":
             return rhoG
@@ -2545,6 +2858,116 @@ class Circuit:
         local_expectation, rehearse="tn"
     )
 
+    def local_expectation_many(
+        self,
+        G,
+        wheres,
+        optimize="auto-hq",
+        simplify_sequence="ADCRS",
+        simplify_atol=1e-12,
+        simplify_equalize_norms=False,
+        backend=None,
+        dtype="complex128",
+        executor=None,
+        share_expressions=False,
+    ):
+        r"""Compute the expectation value of operator(s) ``G`` for each set of
+        sites in ``wheres``, making use of reverse lightcone cancellation.
+        The contraction expression for each lightcone tensor network is cached
+        on its geometry, and so only needs to be found once.
+
+        Parameters
+        ----------
+        G : array or sequence[array]
+            The raw operator(s) to find the expectation of.
+        wheres : sequence of int or sequence of sequence of int
+            The qubits to compute the expectation of ``G`` on, one entry per
+            expectation value.
+        optimize : str, optional
+            Contraction path optimizer to use for the local expectations.
+        simplify_sequence : str, optional
+            Which local tensor network simplifications to perform and in which
+            order, see
+            :meth:`~quimb.tensor.tensor_core.TensorNetwork.full_simplify`.
+        simplify_atol : float, optional
+            The tolerance with which to compare to zero when applying
+            :meth:`~quimb.tensor.tensor_core.TensorNetwork.full_simplify`.
+        simplify_equalize_norms : bool, optional
+            Actively renormalize tensor norms during simplification.
+        backend : str, optional
+            Backend to perform the contractions with, e.g. ``'numpy'``,
+            ``'cupy'`` or ``'jax'``. Passed to ``cotengra``.
+        dtype : str, optional
+            Data type to cast the TN to before contraction.
+        executor : Executor, optional
+            If supplied, the contractions, which are independent once the
+            tensor networks and expressions have been built (in serial), are
+            submitted to this executor, e.g. a ``ThreadPoolExecutor``.
+        share_expressions : bool, optional
+            Whether to first put the tensors of each lightcone into a
+            canonical order, so that lightcones which are structurally
+            identical but labelled differently (e.g. the edges of a regular
+            graph for a QAOA circuit) share a single contraction expression.
+            This has an overhead per lightcone, so is only worth it when the
+            path optimization is expensive relative to that, e.g. for
+            ``'auto-hq'`` or a hyper optimizer.
+
+        Returns
+        -------
+        list[scalar] or list[tuple[scalar]]
+        """
+        self._maybe_init_storage()
+
+        tasks = []
+        for where in wheres:
+            rhoG, output_inds = self._get_local_expectation_tn(
+                G,
+                where,
+                simplify_sequence=simplify_sequence,
+                simplify_atol=simplify_atol,
+                simplify_equalize_norms=simplify_equalize_norms,
+                dtype=dtype,
+            )
+
+            if share_expressions:
+                # put the tensors in a structural order, so that lightcones
+                # which are isomorphic (e.g. different edges of a regular
+                # graph) share the same geometry and thus expression
+                rhoG = _canonize_tn_order(rhoG, output_inds)
+
+            key = (
+                "local_expectation_expression",
+                rhoG.geometry_hash(output_inds, strict_index_order=True),
+                optimize,
+            )
+            try:
+                expr = self._storage[key]
+            except KeyError:
+                expr = self._storage[key] = rhoG.contract(
+                    all,
+                    output_inds=output_inds,
+                    optimize=optimize,
+                    get="expression",
+                )
+
+            tasks.append((expr, rhoG.arrays, bool(output_inds)))
+
+        if executor is None:
+            g_exs = [
+                expr(*arrays, backend=backend) for expr, arrays, _ in tasks
+            ]
+        else:
+            futures = [
+                executor.submit(expr, *arrays, backend=backend)
+                for expr, arrays, _ in tasks
+            ]
+            g_exs = [f.result() for f in futures]
+
+        return [
+            tuple(g_ex) if stacked else maybe_realify_scalar(g_ex)
+            for g_ex, (_, _, stacked) in zip(g_exs, tasks)
+        ]
+
     def compute_marginal(
         self,
         where,
@@ -2565,8 +2988,9 @@ class Circuit:
         ----------
         where : sequence of int
             The qubits to compute the marginal probability distribution of.
-        fix : None or dict[int, str], optional
-            Measurement results on other qubits to fix.
+        fix : None or dict[int, int or str], optional
+            Measurement results on other qubits to fix, each as ``0``/``1``
+            (or ``'0'``/``'1'``).
         optimize : str, optional
             Contraction path optimizer to use for the marginal, can be
             a reusable path optimizer as only called once (though path won't be
@@ -2761,6 +3185,78 @@ class Circuit:
             tuple(sorted(g)) for g in partition_all(group_size, order)
         )
 
+    def _sample_bits(
+        self,
+        C,
+        qubits=None,
+        order=None,
+        group_size=1,
+        max_marginal_storage=2**20,
+        seed=None,
+        optimize="auto-hq",
+        backend=None,
+        dtype="complex64",
+        simplify_sequence="ADCRS",
+        simplify_atol=1e-6,
+        simplify_equalize_norms=False,
+    ):
+        """Generator of the samples for
+        :meth:`~quimb.tensor.circuit.Circuit.sample`, each as ``bytes`` of
+        0s and 1s ordered like ``qubits``.
+        """
+        # init TN norms, contraction paths, and marginals
+        self._maybe_init_storage()
+
+        # which qubits and an ordering e.g. (2, 3, 4, 5), (5, 3, 4, 2)
+        qubits, order = self._parse_qubits_order(qubits, order)
+
+        # group the ordering e.g. ((5, 3), (4, 2))
+        groups = self._group_order(order, group_size)
+
+        if seed is not None:
+            np.random.seed(seed)
+
+        result = dict()
+        for _ in range(C):
+            for where in groups:
+                # key - (tuple[int] where, tuple[tuple[int q, int b])
+                # value  - marginal probability distribution of `where` given
+                #     prior results, as an ndarray
+                # e.g. ((2,), ((0, 0), (1, 0))): array([1., 0.]), means
+                #     prob(qubit2=0)=1 given qubit0=0 and qubit1=0
+                #     prob(qubit2=1)=0 given qubit0=0 and qubit1=0
+                key = (where, tuple(sorted(result.items())))
+                if key not in self._sampled_conditionals:
+                    # compute p(qs=x | current bitstring)
+                    p = self.compute_marginal(
+                        where=where,
+                        fix=result,
+                        optimize=optimize,
+                        backend=backend,
+                        dtype=dtype,
+                        simplify_sequence=simplify_sequence,
+                        simplify_atol=simplify_atol,
+                        simplify_equalize_norms=simplify_equalize_norms,
+                    )
+                    p = do("to_numpy", p).astype("float64")
+                    p /= p.sum()
+
+                    if self._marginal_storage_size <= max_marginal_storage:
+                        self._sampled_conditionals[key] = p
+                        self._marginal_storage_size += p.size
+                else:
+                    p = self._sampled_conditionals[key]
+
+                # the sampled outcome as an integer, e.g. 0b001010101
+                x = int(np.random.choice(p.size, p=p.flat))
+
+                # split back into individual qubit results, last bit first
+                for k, q in enumerate(reversed(where)):
+                    result[q] = (x >> k) & 1
+
+            yield bytes([result[i] for i in qubits])
+            result.clear()
+
     def sample(
         self,
         C,
@@ -2865,58 +3361,56 @@ class Circuit:
         ------
         bitstrings : sequence of str
         """
-        # init TN norms, contraction paths, and marginals
-        self._maybe_init_storage()
-
-        # which qubits and an ordering e.g. (2, 3, 4, 5), (5, 3, 4, 2)
-        qubits, order = self._parse_qubits_order(qubits, order)
-
-        # group the ordering e.g. ((5, 3), (4, 2))
-        groups = self._group_order(order, group_size)
-
-        if seed is not None:
-            np.random.seed(seed)
+        for bits in self._sample_bits(
+            C,
+            qubits=qubits,
+            order=order,
+            group_size=group_size,
+            max_marginal_storage=max_marginal_storage,
+            seed=seed,
+            optimize=optimize,
+            backend=backend,
+            dtype=dtype,
+            simplify_sequence=simplify_sequence,
+            simplify_atol=simplify_atol,
+            simplify_equalize_norms=simplify_equalize_norms,
+        ):
+            yield bits_to_bitstring(bits)
 
-        result = dict()
-        for _ in range(C):
-            for where in groups:
-                # key - (tuple[int] where, tuple[tuple[int q, str b])
-                # value  - marginal probability distribution of `where` given
-                #     prior results, as an ndarray
-                # e.g. ((2,), ((0, '0'), (1, '0'))): array([1., 0.]), means
-                #     prob(qubit2='0')=1 given qubit0='0' and qubit1='0'
-                #     prob(qubit2='1')=0 given qubit0='0' and qubit1='0'
-                key = (where, tuple(sorted(result.items())))
-                if key not in self._sampled_conditionals:
-                    # compute p(qs=x | current bitstring)
-                    p = self.compute_marginal(
-                        where=where,
-                        fix=result,
-                        optimize=optimize,
-                        backend=backend,
-                        dtype=dtype,
-                        simplify_sequence=simplify_sequence,
-                        simplify_atol=simplify_atol,
-                        simplify_equalize_norms=simplify_equalize_norms,
-                    )
-                    p = do("to_numpy", p).astype("float64")
-                    p /= p.sum()
+    def sample_ints(self, C, qubits=None, **sample_opts):
+        """Sample the circuit ``C`` times, like
+        :meth:`~quimb.tensor.circuit.Circuit.sample`, but return the samples
+        as an array of integers rather than yielding bitstrings. The first
+        qubit in ``qubits`` is the most significant bit, such that each entry
+        is equal to ``int(bitstring, 2)``.
 
-                    if self._marginal_storage_size <= max_marginal_storage:
-                        self._sampled_conditionals[key] = p
-                        self._marginal_storage_size += p.size
-                else:
-                    p = self._sampled_conditionals[key]
+        Parameters
+        ----------
+        C : int
+            The number of times to sample.
+        qubits : None or sequence of int, optional
+            Which qubits to measure, defaults (``None``) to all qubits. At
+            most 32 can be measured.
+        sample_opts
+            Supplied to :meth:`~quimb.tensor.circuit.Circuit.sample`.
 
-                # the sampled bitstring e.g. '1' or '001010101'
-                b_where = sample_bitstring_from_prob_ndarray(p)
+        Returns
+        -------
+        numpy.ndarray
+            The samples, of shape ``(C,)`` and dtype ``uint32``.
+        """
+        nq = self.N if qubits is None else len(qubits)
+        if nq > 32:
+            raise ValueError(
+                f"Can only pack up to 32 qubits into integers, got {nq}."
+            )
 
-                # split back into individual qubit results
-                for q, b in zip(where, b_where):
-                    result[q] = b
+        # pack each sample as it is generated
+        out = np.empty(C, dtype=np.uint32)
+        for i, b in enumerate(self._sample_bits(C, qubits, **sample_opts)):
+            out[i] = _bits_to_int(np.frombuffer(b, dtype=np.uint8))
 
-            yield "".join(result[i] for i in qubits)
-            result.clear()
+        return out
 
     def sample_rehearse(
         self,
@@ -2947,7 +3441,7 @@ class Circuit:
             is the fewer marginals need to be computed, which can be faster at
             the cost of higher memory. The marginal's size itself is
             exponential in ``group_size``.
-        result : None or dict[int, str], optional
+        result : None or dict[int, int or str], optional
             Explicitly check the computational cost of this result, assumed to
             be all zeros if not given.
         optimize : str, optional
@@ -3008,6 +3502,77 @@ class Circuit:
 
     sample_tns = functools.partialmethod(sample_rehearse, rehearse="tn")
 
+    def _sample_chaotic_bits(
+        self,
+        C,
+        marginal_qubits,
+        max_marginal_storage=2**20,
+        seed=None,
+        optimize="auto-hq",
+        backend=None,
+        dtype="complex64",
+        simplify_sequence="ADCRS",
+        simplify_atol=1e-6,
+        simplify_equalize_norms=False,
+    ):
+        """Generator of the samples for
+        :meth:`~quimb.tensor.circuit.Circuit.sample_chaotic`, each as
+        ``bytes`` of 0s and 1s for every qubit.
+        """
+        # init TN norms, contraction paths, and marginals
+        self._maybe_init_storage()
+        qubits = tuple(range(self.N))
+
+        if seed is not None:
+            np.random.seed(seed)
+
+        # choose which qubits to treat as marginal - ideally 'towards one side'
+        #     to increase contraction efficiency
+        if isinstance(marginal_qubits, numbers.Integral):
+            marginal_qubits = self.calc_qubit_ordering()[:marginal_qubits]
+        where = tuple(sorted(marginal_qubits))
+
+        # we will uniformly sample, and post-select on, the remaining qubits
+        fix_qubits = tuple(q for q in qubits if q not in where)
+
+        result = dict()
+        for _ in range(C):
+            # generate a random bit-string for the fixed qubits
+            for q in fix_qubits:
+                result[q] = int(np.random.choice(2))
+
+            # compute the remaining marginal
+            key = (where, tuple(sorted(result.items())))
+            if key not in self._sampled_conditionals:
+                p = self.compute_marginal(
+                    where=where,
+                    fix=result,
+                    optimize=optimize,
+                    backend=backend,
+                    dtype=dtype,
+                    simplify_sequence=simplify_sequence,
+                    simplify_atol=simplify_atol,
+                    simplify_equalize_norms=simplify_equalize_norms,
+                )
+                p = do("to_numpy", p).astype("float64")
+                p /= p.sum()
+
+                if self._marginal_storage_size <= max_marginal_storage:
+                    self._sampled_conditionals[key] = p
+                    self._marginal_storage_size += p.size
+            else:
+                p = self._sampled_conditionals[key]
+
+            # sample an outcome for the marginal qubits, as an integer
+            x = int(np.random.choice(p.size, p=p.flat))
+
+            # split back into individual qubit results, last bit first
+            for k, q in enumerate(reversed(where)):
+                result[q] = (x >> k) & 1
+
+            yield bytes([result[i] for i in qubits])
+            result.clear()
+
     def sample_chaotic(
         self,
         C,
@@ -3080,59 +3645,19 @@ class Circuit:
         ------
         str
         """
-        # init TN norms, contraction paths, and marginals
-        self._maybe_init_storage()
-        qubits = tuple(range(self.N))
-
-        if seed is not None:
-            np.random.seed(seed)
-
-        # choose which qubits to treat as marginal - ideally 'towards one side'
-        #     to increase contraction efficiency
-        if isinstance(marginal_qubits, numbers.Integral):
-            marginal_qubits = self.calc_qubit_ordering()[:marginal_qubits]
-        where = tuple(sorted(marginal_qubits))
-
-        # we will uniformly sample, and post-select on, the remaining qubits
-        fix_qubits = tuple(q for q in qubits if q not in where)
-
-        result = dict()
-        for _ in range(C):
-            # generate a random bit-string for the fixed qubits
-            for q in fix_qubits:
-                result[q] = np.random.choice(("0", "1"))
-
-            # compute the remaining marginal
-            key = (where, tuple(sorted(result.items())))
-            if key not in self._sampled_conditionals:
-                p = self.compute_marginal(
-                    where=where,
-                    fix=result,
-                    optimize=optimize,
-                    backend=backend,
-                    dtype=dtype,
-                    simplify_sequence=simplify_sequence,
-                    simplify_atol=simplify_atol,
-                    simplify_equalize_norms=simplify_equalize_norms,
-                )
-                p = do("to_numpy", p).astype("float64")
-                p /= p.sum()
-
-                if self._marginal_storage_size <= max_marginal_storage:
-                    self._sampled_conditionals[key] = p
-                    self._marginal_storage_size += p.size
-            else:
-                p = self._sampled_conditionals[key]
-
-            # sample a bit-string for the marginal qubits
-            b_where = sample_bitstring_from_prob_ndarray(p)
-
-            # split back into individual qubit results
-            for q, b in zip(where, b_where):
-                result[q] = b
-
-            yield "".join(result[i] for i in qubits)
-            result.clear()
+        for bits in self._sample_chaotic_bits(
+            C,
+            marginal_qubits,
+            max_marginal_storage=max_marginal_storage,
+            seed=seed,
+            optimize=optimize,
+            backend=backend,
+            dtype=dtype,
+            simplify_sequence=simplify_sequence,
+            simplify_atol=simplify_atol,
+            simplify_equalize_norms=simplify_equalize_norms,
+        ):
+            yield bits_to_bitstring(bits)
 
     def sample_chaotic_rehearse(
         self,
@@ -3154,7 +3679,7 @@ class Circuit:
             The number of qubits to treat as marginal, or the actual qubits. If
             an int is given then the qubits treated as marginal will be
             ``circuit.calc_qubit_ordering()[:marginal_qubits]``.
-        result : None or dict[int, str], optional
+        result : None or dict[int, int or str], optional
             Explicitly check the computational cost of this result, assumed to
             be all zeros if not given.
         optimize : str, optional
@@ -3578,6 +4103,39 @@ class CircuitDense(Circuit):
         gate_opts.setdefault("contract", gate_contract)
         super().__init__(N, psi0, gate_opts, tags)
 
+    def _apply_gate(self, gate, tags=None, **gate_opts):
+        """Apply a ``Gate`` to this ``CircuitDense``. If the state is already a
+        single dense tensor and the gate is to be contracted in, this is
+        performed directly as a matrix multiplication, bypassing the generic
+        tensor network gate machinery.
+        """
+        contract = gate_opts.get("contract", self.gate_opts["contract"])
+        if (
+            (contract is not True)
+            or gate.controls
+            or gate.special
+            or gate.parametrize
+            or (self._psi.num_tensors != 1)
+        ):
+            return super()._apply_gate(gate, tags=tags, **gate_opts)
+
+        (t,) = self._psi.tensor_map.values()
+        axes = tuple(t.inds.index(self._psi.site_ind(q)) for q in gate.qubits)
+        perm, inv_perm = _dense_gate_perms(axes, t.ndim)
+
+        # move the gated axes to the front and fuse, e.g. into (4, 2**(N-2))
+        shape = tuple(t.shape[ax] for ax in perm)
+        dg = math.prod(shape[: len(axes)])
+        data = reshape(do("transpose", t.data, perm), (dg, -1))
+
+        G = reshape(gate.array, (dg, dg))
+        data = reshape(G @ data, shape)
+        t.modify(data=do("transpose", data, inv_perm))
+        t.add_tag(self._get_gate_tags(gate, tags))
+
+        # keep track of the gates applied
+        self.gates.append(gate)
+
     @property
     def psi(self):
         t = self._psi ^ ...
@@ -9944,6 +9944,7 @@ class TensorNetwork(object):
         split_simplify_opts=None,
         custom_methods=(),
         split_method="svd",
+        min_width=None,
     ):
         """Perform a series of tensor network 'simplifications' in a loop until
         there is no more reduction in the number of tensors or indices. Note
@@ -9986,6 +9987,12 @@ class TensorNetwork(object):
             Show a live progress bar of the simplification process.
         inplace : bool, optional
             Whether to perform the simplification inplace.
+        min_width : float, optional
+            If given, first estimate the contraction width of the tensor
+            network (using a greedy path), and if it is below this value skip
+            the simplifications entirely, returning the network unchanged. For
+            small networks the simplifications can be much more expensive than
+            simply performing the contraction.
 
         Returns
         -------
@@ -9998,6 +10005,13 @@ class TensorNetwork(object):
         """
         tn = self if inplace else self.copy()
 
+        if min_width is not None:
+            width = tn.contraction_width(
+                optimize="greedy", output_inds=output_inds
+            )
+            if width < min_width:
+                return tn
+
         rank_simplify_opts = ensure_dict(rank_simplify_opts)
         loop_simplify_opts = ensure_dict(loop_simplify_opts)
         loop_simplify_opts.setdefault("method", split_method)
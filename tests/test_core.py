@@ -375,6 +375,15 @@ class Testikron:
         b = qu.ikron(a, dims, inds)
         assert_allclose(b, i & a[2] & i & i & a[1] & a[0])
 
+    def test_dense_matches_sparse(self):
+        a = [qu.rand_matrix(6), qu.rand_matrix(3)]
+        dims = [2, 3, 2, 3, 4, 3]
+        inds = [0, 1, 5]
+        b = qu.ikron(a, dims, inds, sparse=False)
+        bs = qu.ikron(a, dims, inds, sparse=True)
+        assert not qu.issparse(b)
+        assert_allclose(b, bs.toarray())
+
     def test_auto(self):
         a = qu.rand_matrix(2)
         i = qu.eye(2)
@@ -0,0 +1,72 @@
+import ast
+import sys
+import subprocess
+import textwrap
+
+import quimb
+
+
+def run_in_fresh_process(code):
+    # module caching means lazy imports have to be checked in a new process
+    subprocess.run(
+        [sys.executable, "-c", textwrap.dedent(code)],
+        check=True,
+    )
+
+
+class TestLazyImports:
+
+    def test_import_is_lazy(self):
+        run_in_fresh_process(
+            """
+            import os
+            import sys
+            import quimb
+            assert "numpy" not in sys.modules
+            assert "quimb.core" not in sys.modules
+            # needs to be set before numba is imported
+            assert "NUMBA_NUM_THREADS" in os.environ
+            """
+        )
+
+    def test_all_names_resolve(self):
+        run_in_fresh_process(
+            """
+            import quimb
+            for name in quimb.__all__:
+                getattr(quimb, name)
+            assert set(quimb.__all__) <= set(dir(quimb))
+            """
+        )
+
+    def test_submodules(self):
+        run_in_fresh_process(
+            """
+            import quimb
+            assert quimb.tensor.Circuit is not None
+            assert quimb.utils.oset is quimb.oset
+            """
+        )
+
+    def test_lazy_names_in_sync(self):
+        with open(quimb.__file__) as f:
+            tree = ast.parse(f.read())
+
+        math_names = set()
+        type_checking_imports = {}
+        for node in tree.body:
+            if isinstance(node, ast.ImportFrom) and node.module == "math":
+                math_names.update(alias.name for alias in node.names)
+            elif (
+                isinstance(node, ast.If)
+                and getattr(node.test, "id", None) == "TYPE_CHECKING"
+            ):
+                for imp in node.body:
+                    module = "." * imp.level + imp.module
+                    type_checking_imports[module] = tuple(
+                        alias.name for alias in imp.names
+                    )
+
+        assert type_checking_imports == quimb._LAZY_IMPORTS
+        assert set(quimb._LAZY) == set(quimb.__all__) - math_names
+        assert len(quimb.__all__) == len(set(quimb.__all__))
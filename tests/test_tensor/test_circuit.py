@@ -1,9 +1,14 @@
 import math
+import cmath
+import random
+import functools
 import itertools
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
 import numpy as np
 from numpy.testing import assert_allclose
+from scipy.stats import power_divergence
 
 import quimb as qu
 import quimb.tensor as qtn
@@ -11,23 +16,31 @@ import quimb.tensor as qtn
 
 def rand_reg_graph(reg, n, seed=None):
     import networkx as nx
-    G = nx.random_regular_graph(reg, n, seed=seed)
-    return G
+
+    if seed is None:
+        return nx.random_regular_graph(reg, n)
+    # seeded graphs are deterministic so can be shared (n.b. don't mutate)
+    return _seeded_rand_reg_graph(reg, n, seed)
+
+
+@functools.lru_cache(maxsize=None)
+def _seeded_rand_reg_graph(reg, n, seed):
+    import networkx as nx
+    return nx.random_regular_graph(reg, n, seed=seed)
 
 
 def graph_to_qsim(G, gamma0=-0.743043, beta0=0.754082):
     n = G.number_of_nodes()
+    rzz = f"Rzz {gamma0} "
+    rx = f"Rx {beta0} "
 
     # add all the gates
-    circ = f"{n}\n"
-    for i in range(n):
-        circ += f"H {i}\n"
-    for i, j in G.edges:
-        circ += f"Rzz {gamma0} {i} {j}\n"
-    for i in range(n):
-        circ += f"Rx {beta0} {i}\n"
+    lines = [str(n)]
+    lines.extend(f"H {i}" for i in range(n))
+    lines.extend(f"{rzz}{i} {j}" for i, j in G.edges)
+    lines.extend(f"{rx}{i}" for i in range(n))
 
-    return circ
+    return "\n".join(lines) + "\n"
 
 
 def random_a2a_circ(L, depth, seed=42):
@@ -125,6 +138,23 @@ def example_openqasm2_qft():
     """
 
 
+def num_local_expectation_expressions(circ):
+    return sum(
+        key[0] == "local_expectation_expression" for key in circ._storage
+    )
+
+
+@pytest.fixture(scope='session')
+def reg3_n18_qsim():
+    return graph_to_qsim(rand_reg_graph(reg=3, n=18, seed=42))
+
+
+@pytest.fixture(scope='class')
+def circ_L5_d3():
+    circ = random_a2a_circ(5, 3)
+    return circ, circ.to_dense()
+
+
 class TestCircuit:
 
     def test_prepare_GHZ(self):
@@ -146,18 +176,14 @@ class TestCircuit:
         assert '111' in counts
         assert counts['000'] + counts['111'] == 1024
 
-    def test_from_qsim(self):
-        G = rand_reg_graph(reg=3, n=18, seed=42)
-        qsim = graph_to_qsim(G)
-        qc = qtn.Circuit.from_qsim_str(qsim)
-        assert (qc.psi.H & qc.psi) ^ all == pytest.approx(1.0)
+    def test_from_qsim(self, reg3_n18_qsim):
+        qc = qtn.Circuit.from_qsim_str(reg3_n18_qsim)
+        assert qc.norm(optimize="greedy") == pytest.approx(1.0)
 
-    def test_from_qsim_mps_swapsplit(self):
-        G = rand_reg_graph(reg=3, n=18, seed=42)
-        qsim = graph_to_qsim(G)
-        qc = qtn.CircuitMPS.from_qsim_str(qsim)
+    def test_from_qsim_mps_swapsplit(self, reg3_n18_qsim):
+        qc = qtn.CircuitMPS.from_qsim_str(reg3_n18_qsim)
         assert len(qc.psi.tensors) == 18
-        assert (qc.psi.H & qc.psi) ^ all == pytest.approx(1.0)
+        assert qc.norm(optimize="greedy") == pytest.approx(1.0)
 
     def test_from_openqasm2(self):
         qc = qtn.Circuit.from_openqasm2_str(example_openqasm2_qft())
@@ -167,8 +193,6 @@ class TestCircuit:
         'Circ', [qtn.Circuit, qtn.CircuitMPS, qtn.CircuitDense]
     )
     def test_all_gate_methods(self, Circ):
-        import random
-
         g_nq_np = [
             # single qubit
             ('x', 1, 0),
@@ -224,9 +248,53 @@ class TestCircuit:
             ]
             getattr(circ, g)(*args)
 
-        assert circ.psi.H @ circ.psi == pytest.approx(1.0)
+        assert circ.norm(optimize="greedy") == pytest.approx(1.0)
         assert abs((circ.psi.H & psi0) ^ all) < 0.99999999
 
+    def test_norm_expression_cached(self):
+        circ = qft_circ(4)
+        norm, expr = circ.get_norm_expression(optimize="greedy")
+        assert circ.get_norm_expression(optimize="greedy")[1] is expr
+        assert expr(*norm.arrays) == pytest.approx(1.0)
+        # changing the circuit should invalidate the cache
+        circ.h(0)
+        assert circ.get_norm_expression(optimize="greedy")[1] is not expr
+        assert circ.norm(optimize="greedy") == pytest.approx(1.0)
+
+    def test_dense_gates_match(self, monkeypatch):
+        # a single dense tensor, so every gate can use the matmul path
+        psi0 = qtn.Dense1D(qu.rand_ket(2**4))
+        gates = [
+            ('h', 0),
+            ('cx', 0, 3),
+            ('iswap', 2, 1),
+            ('rx', 0.3, 2),
+            ('u3', 0.1, 0.2, 0.3, 1),
+            ('fsim', 0.4, 0.5, 3, 0),
+            ('ccz', 2, 0, 1),
+            ('swap', 1, 3),
+            ('cy', 1, 2),
+        ]
+        circ = qtn.Circuit(psi0=psi0)
+        circ.apply_gates(gates)
+
+        # check only 'special' gates like SWAP, which simply relabel indices,
+        # fall back to the generic tensor network method
+        generic_apply_gate = qtn.Circuit._apply_gate
+
+        def checked_apply_gate(self, gate, *args, **kwargs):
+            assert gate.special, f"{gate} not applied by matmul."
+            return generic_apply_gate(self, gate, *args, **kwargs)
+
+        monkeypatch.setattr(qtn.Circuit, "_apply_gate", checked_apply_gate)
+        circ_dense = qtn.CircuitDense(psi0=psi0)
+        circ_dense.apply_gates(gates)
+        monkeypatch.undo()
+
+        assert circ_dense._psi.num_tensors == 1
+        assert_allclose(circ_dense.to_dense(), circ.to_dense())
+        assert 'GATE_8' in circ_dense.psi.tags
+
     def test_su4(self):
         psi0 = qtn.MPS_rand_state(2, 2)
         circ_a = qtn.Circuit(psi0=psi0)
@@ -301,9 +369,6 @@ class TestCircuit:
 
     @pytest.mark.parametrize("gate2", ['cx', 'iswap'])
     def test_circuit_simplify_tensor_network(self, gate2):
-        import random
-        import itertools
-
         depth = n = 8
 
         circ = qtn.Circuit(n)
@@ -352,20 +417,32 @@ class TestCircuit:
         cw_s = tn_s.contraction_width(output_inds=[])
         assert cw_s <= cw
 
-    def test_amplitude(self):
-        L = 5
-        circ = random_a2a_circ(L, 3)
-        psi = circ.to_dense()
+        # small enough networks can opt out of simplification entirely
+        tn_n = tn.full_simplify(min_width=cw + 1)
+        assert tn_n.num_tensors == tn.num_tensors
+
+    def test_amplitude(self, circ_L5_d3):
+        circ, psi = circ_L5_d3
+        L = circ.N
 
-        for i in range(2**L):
-            b = f"{i:0>{L}b}"
-            c = circ.amplitude(b)
+        bs = [f"{i:0>{L}b}" for i in range(2**L)]
+        cs = circ.amplitudes(bs)
+        assert_allclose(cs, psi.ravel())
+
+        for i in (0, 7, 2**L - 1):
+            c = circ.amplitude(bs[i])
             assert c == pytest.approx(psi[i, 0])
 
-    def test_partial_trace(self):
-        L = 5
-        circ = random_a2a_circ(L, 3)
-        psi = circ.to_dense()
+        # bad or empty input should return before any simplification
+        nstored = len(circ._storage)
+        assert circ.amplitudes([], optimize="greedy").shape == (0,)
+        with pytest.raises(ValueError):
+            circ.amplitudes(["01201"], optimize="greedy")
+        assert len(circ._storage) == nstored
+
+    def test_partial_trace(self, circ_L5_d3):
+        circ, psi = circ_L5_d3
+        L = circ.N
         for i in range(L - 1):
             keep = (i, i + 1)
             assert_allclose(qu.partial_trace(psi, [2] * 5, keep=keep),
@@ -373,49 +450,40 @@ class TestCircuit:
                             atol=1e-12)
 
     @pytest.mark.parametrize("group_size", (1, 2, 6))
-    def test_sample(self, group_size):
-        import collections
-        from scipy.stats import power_divergence
-
+    def test_sample(self, group_size, circ_L5_d3):
         C = 2**10
-        L = 5
-        circ = random_a2a_circ(L, 3)
+        circ, psi = circ_L5_d3
+        L = circ.N
 
-        psi = circ.to_dense()
         p_exp = abs(psi.reshape(-1))**2
         f_exp = p_exp * C
 
-        counts = collections.Counter(circ.sample(C, group_size=group_size))
-        f_obs = np.zeros(2**L)
-        for b, c in counts.items():
-            f_obs[int(b, 2)] = c
+        samples = circ.sample_ints(C, group_size=group_size)
+        assert samples.dtype == np.uint32
+        f_obs = np.bincount(samples, minlength=2**L).astype(float)
 
         assert power_divergence(f_obs, f_exp)[0] < 100
 
     def test_sample_chaotic(self):
-        import collections
-        from scipy.stats import power_divergence
-
         C = 2**12
         L = 5
         reps = 3
         depth = 2
         goodnesses = [0] * 5
 
-        for _ in range(reps):
-            circ = random_a2a_circ(L, depth)
-
-            psi = circ.to_dense()
-            p_exp = abs(psi.reshape(-1))**2
-            f_exp = p_exp * C
+        # the circuit is seeded, so only needs constructing once
+        circ = random_a2a_circ(L, depth)
+        psi = circ.to_dense()
+        p_exp = abs(psi.reshape(-1))**2
+        f_exp = p_exp * C
 
+        for _ in range(reps):
             for num_marginal in [3, 4, 5]:
-                counts = collections.Counter(
-                    circ.sample_chaotic(C, num_marginal, seed=666)
+                samples = circ.sample_chaotic(C, num_marginal, seed=666)
+                idx = np.fromiter(
+                    (int(b, 2) for b in samples), dtype=np.int64, count=C
                 )
-                f_obs = np.zeros(2**L)
-                for b, c in counts.items():
-                    f_obs[int(b, 2)] = c
+                f_obs = np.bincount(idx, minlength=2**L).astype(float)
 
                 goodness = power_divergence(f_obs, f_exp)[0]
                 goodnesses[num_marginal - 1] += goodness
@@ -423,15 +491,13 @@ class TestCircuit:
         # assert average sampling goodness gets better with larger marginal
         assert sum(goodnesses[i] < goodnesses[i - 1] for i in range(1, L)) == 2
 
-    def test_local_expectation(self):
-        import random
-        L = 5
-        depth = 3
-        circ = random_a2a_circ(L, depth)
-        psi = circ.to_dense()
-        for _ in range(10):
-            G = qu.rand_matrix(4)
-            i = random.randint(0, L - 2)
+    def test_local_expectation(self, circ_L5_d3):
+        circ, psi = circ_L5_d3
+        L = circ.N
+        rng = np.random.default_rng(0)
+        shape = (10, 4, 4)
+        Gs = rng.standard_normal(shape) + 1j * rng.standard_normal(shape)
+        for G, i in zip(Gs, rng.integers(0, L - 1, size=10)):
             where = (i, i + 1)
             x1 = qu.expec(qu.ikron(G, [2] * L, where), psi)
             x2 = circ.local_expectation(G, where)
@@ -447,6 +513,8 @@ class TestCircuit:
         assert exps[0] == pytest.approx(-1)
         assert exps[1] == pytest.approx(-1)
         assert exps[2] == pytest.approx(-1)
+        (exps_many,) = circ.local_expectation_many(Gs, [(0, 1)])
+        assert exps_many == pytest.approx(exps)
 
     def test_local_expectation_len1(self):
         circ = qtn.Circuit(1)
@@ -454,7 +522,6 @@ class TestCircuit:
         circ.local_expectation([qu.pauli("X")], (0,))
 
     def test_uni_to_dense(self):
-        import cmath
         circ = qft_circ(3)
         U = circ.uni.to_dense()
         w = cmath.exp(2j * math.pi / 2**3)
@@ -539,8 +606,6 @@ class TestCircuit:
         assert_allclose(U, qu.fredkin())
 
     def test_multi_controlled_circuit(self):
-        import random
-
         N = 10
         circ = qtn.Circuit(N)
         regs = list(range(N))
@@ -597,6 +662,21 @@ class TestCircuitGen:
 
         assert all(isinstance(t, qtn.PTensor) for t in tn['U3'])
 
+    def test_local_expectation_many_ring(self):
+        n = 8
+        terms = {(i, (i + 1) % n): 1.0 for i in range(n)}
+        circ = qtn.circ_qaoa(terms, 1, [-0.6], [-0.4])
+        ZZ = qu.pauli('Z') & qu.pauli('Z')
+        xs = circ.local_expectation_many(
+            ZZ, terms, optimize="greedy", share_expressions=True
+        )
+        # every edge of a ring is equivalent
+        assert num_local_expectation_expressions(circ) == 1
+        for x, edge in zip(xs, terms):
+            assert x == pytest.approx(
+                circ.local_expectation(ZZ, edge, optimize="greedy")
+            )
+
     def test_qaoa(self):
         G = rand_reg_graph(3, 10, seed=666)
         terms = {(i, j): 1. for i, j in G.edges}
@@ -608,9 +688,10 @@ class TestCircuitGen:
         circ1 = qtn.circ_qaoa(terms, 1, gammas, betas)
 
         energy1 = sum(
-            circ1.local_expectation(ZZ, edge)
-            for edge in terms
+            circ1.local_expectation_many(ZZ, terms, share_expressions=True)
         )
+        # isomorphic edge lightcones should share contraction expressions
+        assert num_local_expectation_expressions(circ1) < len(terms)
         assert energy1 < -4
 
         gammas = [-0.4]
@@ -618,8 +699,9 @@ class TestCircuitGen:
 
         circ2 = qtn.circ_qaoa(terms, 1, gammas, betas)
 
-        energy2 = sum(
-            circ2.local_expectation(ZZ, edge)
-            for edge in terms
-        )
+        # the contractions for each edge are independent
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            energy2 = sum(
+                circ2.local_expectation_many(ZZ, terms, executor=executor)
+            )
         assert energy2 > 4
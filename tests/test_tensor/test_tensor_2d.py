@@ -9,22 +9,41 @@ import quimb as qu
 import quimb.tensor as qtn
 
 
+@pytest.fixture(scope="module")
+def ctg_opt(request, tmp_path_factory):
+    """A reusable hyper optimizer shared by the exact 2D contractions, with
+    paths cached on disk (in the pytest cache if enabled) across runs.
+    """
+    import cotengra as ctg
+
+    cache = getattr(request.config, "cache", None)
+    if cache is not None:
+        directory = cache.mkdir("ctg_cache")
+    else:
+        directory = tmp_path_factory.mktemp("ctg_cache")
+
+    return ctg.ReusableHyperOptimizer(
+        max_repeats=32,
+        max_time=30,
+        parallel=False,
+        directory=str(directory),
+    )
+
+
 class TestPEPSConstruct:
     @pytest.mark.parametrize("Lx", [3, 4, 5])
     @pytest.mark.parametrize("Ly", [3, 4, 5])
     def test_basic_rand(self, Lx, Ly):
-        psi = qtn.PEPS.rand(Lx, Ly, bond_dim=4)
+        psi = qtn.PEPS.rand(Lx, Ly, bond_dim=4, seed=0)
+        sites = tuple(itertools.product(range(Lx), range(Ly)))
+        site_tags = tuple(f"I{i},{j}" for i, j in sites)
 
         assert psi.max_bond() == 4
         assert psi.Lx == Lx
         assert psi.Ly == Ly
         assert len(psi.tensor_map) == Lx * Ly
-        assert psi.site_inds == tuple(
-            f"k{i},{j}" for i in range(Lx) for j in range(Ly)
-        )
-        assert psi.site_tags == tuple(
-            f"I{i},{j}" for i in range(Lx) for j in range(Ly)
-        )
+        assert psi.site_inds == tuple(f"k{i},{j}" for i, j in sites)
+        assert psi.site_tags == site_tags
 
         assert psi.bond_size((1, 1), (1, 2)) == (4)
 
@@ -33,19 +52,18 @@ class TestPEPSConstruct:
         for j in range(Ly):
             assert len(psi.select(f"Y{j}").tensor_map) == Lx
 
-        for i in range(Lx):
-            for j in range(Ly):
-                assert psi.phys_dim(i, j) == 2
-                assert isinstance(psi[i, j], qtn.Tensor)
-                assert isinstance(psi[f"I{i},{j}"], qtn.Tensor)
+        assert all(psi.phys_dim(i, j) == 2 for i, j in sites)
+        assert all(isinstance(psi[site], qtn.Tensor) for site in sites)
+        assert all(isinstance(psi[tag], qtn.Tensor) for tag in site_tags)
 
         if Lx == Ly == 3:
-            psi_dense = psi.to_qarray(optimize="random-greedy")
+            psi_dense = psi.to_qarray(optimize="greedy")
             assert psi_dense.shape == (512, 1)
 
         psi.show()
-        assert f"Lx={Lx}" in psi.__str__()
-        assert f"Lx={Lx}" in psi.__repr__()
+        psi_str, psi_repr = str(psi), repr(psi)
+        assert f"Lx={Lx}" in psi_str
+        assert f"Lx={Lx}" in psi_repr
 
     def test_flatten(self):
         psi = qtn.PEPS.rand(3, 5, 3, seed=42)
@@ -204,25 +222,35 @@ class Test2DContract:
         Z = tn.contract_boundary(max_bond=4, mode=mode)
         assert Z == pytest.approx(Zex, rel=1e-3)
 
-    def test_contract_2d_one_layer_boundary(self):
+    def test_contract_2d_one_layer_boundary(self, ctg_opt):
         psi = qtn.PEPS.rand(4, 4, 3, seed=42)
         norm = psi.make_norm()
-        xe = norm.contract(all, optimize="auto-hq")
-        xt = norm.contract_boundary(max_bond=9)
+        xe = norm.contract(all, optimize=ctg_opt)
+        xt = norm.contract_boundary(
+            max_bond=9, final_contract_opts=dict(optimize=ctg_opt)
+        )
         assert xt == pytest.approx(xe, rel=1e-2)
 
-    def test_contract_2d_two_layer_boundary(self):
+    def test_contract_2d_two_layer_boundary(self, ctg_opt):
         psi = qtn.PEPS.rand(4, 4, 3, seed=42, tags="KET")
         norm = psi.make_norm()
-        xe = norm.contract(all, optimize="auto-hq")
-        xt = norm.contract_boundary(max_bond=27, layer_tags=["KET", "BRA"])
+        xe = norm.contract(all, optimize=ctg_opt)
+        xt = norm.contract_boundary(
+            max_bond=27,
+            layer_tags=["KET", "BRA"],
+            final_contract_opts=dict(optimize=ctg_opt),
+        )
         assert xt == pytest.approx(xe, rel=1e-2)
 
-    def test_contract_2d_full_bond(self):
+    def test_contract_2d_full_bond(self, ctg_opt):
         psi = qtn.PEPS.rand(4, 4, 3, seed=42, tags="KET")
         norm = psi.make_norm()
-        xe = norm.contract(all, optimize="auto-hq")
-        xt = norm.contract_boundary(max_bond=27, mode="full-bond")
+        xe = norm.contract(all, optimize=ctg_opt)
+        xt = norm.contract_boundary(
+            max_bond=27,
+            mode="full-bond",
+            final_contract_opts=dict(optimize=ctg_opt),
+        )
         assert xt == pytest.approx(xe, rel=1e-2)
 
     @pytest.mark.parametrize("dims", [(10, 4), (4, 10)])
@@ -264,7 +292,7 @@ class Test2DContract:
         Zap = tn.item() * 10**tn.exponent
         assert Zap == pytest.approx(8.459419593253275e100, rel=2e-3)
 
-    def test_contract_hotrg_two_layer_rand_peps(self):
+    def test_contract_hotrg_two_layer_rand_peps(self, ctg_opt):
         rng = np.random.default_rng(42)
         psi = qtn.PEPS.from_fill_fn(
             lambda shape: rng.uniform(low=-0.1, size=shape),
@@ -273,7 +301,7 @@ class Test2DContract:
             bond_dim=2,
         )
         norm = psi.make_norm()
-        xe = norm.contract(all, optimize="auto-hq")
+        xe = norm.contract(all, optimize=ctg_opt)
         xt = norm.contract_hotrg(max_bond=5)
         assert xt == pytest.approx(xe, rel=1e-4)
 